@@ -1,21 +1,96 @@
 import base64
-import json
+import io
 import logging
 import os
+import re
 import shutil
 import subprocess
 import sys
+import tarfile
 import tempfile
-import xml.etree.ElementTree as Et
 from argparse import ArgumentParser, Namespace, RawTextHelpFormatter
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+from xml.sax.saxutils import escape
+
+try:
+    from lxml import etree as Et  # type: ignore
+
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as Et  # type: ignore
+
+    HAS_LXML = False
+
+try:
+    import numpy as np  # type: ignore
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from orjson import loads as json_loads  # type: ignore
+except ImportError:
+    from json import loads as json_loads
 
 from svgpathtools import Path as SvgPath  # type: ignore
 
 SVG_NS: dict = {"svg": "http://www.w3.org/2000/svg"}
 
-SMUFL_HEADER = """/////////////////////////////////////////////////////////////////////////////
+# Tokenizer for SVG path data: matches either a command letter or a number.
+PATH_TOKEN = re.compile(r"([MmLlHhVvCcSsQqTtAaZz])|(-?\d*\.?\d+(?:[eE][-+]?\d+)?)")
+
+# FontForge names every codepoint-carrying glyph uniXXXX in the source fonts.
+UNI_GLYPH_NAME = re.compile(r"uni([0-9A-Fa-f]{4})")
+
+# Precompiled XPath queries. lxml recompiles string XPaths on every
+# find/findall call, so the hot queries are compiled once here; the plain
+# ElementTree fallbacks present the same list-returning interface.
+if HAS_LXML:
+    _XP_FONT = Et.XPath("//svg:defs/svg:font", namespaces=SVG_NS)
+    _XP_FONT_FACE = Et.XPath("//svg:font-face", namespaces=SVG_NS)
+    _XP_GLYPH = Et.XPath("//svg:glyph", namespaces=SVG_NS)
+    _XP_HKERN = Et.XPath("//svg:hkern", namespaces=SVG_NS)
+    _XP_METADATA = Et.XPath("//svg:metadata", namespaces=SVG_NS)
+    _XP_SUPPORTED_GLYPH = Et.XPath("//glyph")
+else:
+
+    def _XP_FONT(tree) -> list:
+        el = tree.find(".//svg:defs/svg:font", SVG_NS)
+        return [] if el is None else [el]
+
+    def _XP_FONT_FACE(tree) -> list:
+        return tree.findall(".//svg:font-face", SVG_NS)
+
+    def _XP_GLYPH(tree) -> list:
+        return tree.findall(".//svg:glyph", SVG_NS)
+
+    def _XP_HKERN(tree) -> list:
+        return tree.findall(".//svg:hkern", SVG_NS)
+
+    def _XP_METADATA(tree) -> list:
+        el = tree.find(".//svg:metadata", SVG_NS)
+        return [] if el is None else [el]
+
+    def _XP_SUPPORTED_GLYPH(tree) -> list:
+        return tree.findall(".//glyph")
+
+# Clark-notation tags for the streaming parser.
+SVG_FONT_TAG: str = f"{{{SVG_NS['svg']}}}font"
+SVG_FONT_FACE_TAG: str = f"{{{SVG_NS['svg']}}}font-face"
+SVG_GLYPH_TAG: str = f"{{{SVG_NS['svg']}}}glyph"
+
+# A single parser instance shared by all parse calls. The lxml options lift the
+# "Huge input lookup" size limit (SMuFL SVG fonts can be tens of MB) and skip
+# whitespace-only text nodes we never use. Note that collect_ids=False is not
+# an option here: it makes libxml2 fetch the SVG DTD from the network.
+XML_PARSER = Et.XMLParser(huge_tree=True, remove_blank_text=True) if HAS_LXML else None
+
+SMUFL_HEADER_PREFIX = """/////////////////////////////////////////////////////////////////////////////
 // Name:        smufl.h
 // Author:      Laurent Pugin
 // Created:     2014-2022
@@ -32,15 +107,16 @@ SMUFL_HEADER = """//////////////////////////////////////////////////////////////
 
 //----------------------------------------------------------------------------
 
-namespace vrv {{
+namespace vrv {
 
 //----------------------------------------------------------------------------
 // SMUFL glyphs available by default in Verovio
 //----------------------------------------------------------------------------
 
-enum {{
-{smufl_glyph_list}
-}};
+enum {
+"""
+
+SMUFL_HEADER_SUFFIX = """}};
 
 /** The number of glyphs for verification **/
 #define SMUFL_COUNT {len_smufl_codes}
@@ -50,16 +126,50 @@ enum {{
 #endif
 """
 
-FONTFORGE_SCRIPT = (
-    """import os; fontforge.open("{input_fontpath}").generate("{output_fontpath}")"""
+# Serialization templates for the per-glyph symbol files. The output is a
+# fixed two-element document, so rendering a template is much cheaper than a
+# general XML serializer. No XML declaration and a space before the
+# self-closing slash, matching the ElementTree output these replaced.
+SYMBOL_TMPL = (
+    '<symbol id="{code}" viewBox="0 0 {units} {units}" overflow="inherit">'
+    '<path transform="scale(1,-1)" d="{path_d}" /></symbol>'
 )
+SYMBOL_EMPTY_TMPL = '<symbol id="{code}" viewBox="0 0 {units} {units}" overflow="inherit" />'
+
+# Symbol files are dispatched to the writers in batches of this size while
+# the glyph stream is walked, and at most SYMBOL_MAX_PENDING batches are in
+# flight at once, so the walk never retains the whole font's path data.
+SYMBOL_BATCH_SIZE = 64
+SYMBOL_MAX_PENDING = 4 * (os.cpu_count() or 1)
+
+# Bootstrap script for the long-lived FontForge worker. It is passed with
+# -c (a script piped on stdin would only run at EOF) and then reads one
+# tab-separated "input\toutput" conversion per stdin line, acknowledging
+# each with a sentinel so the parent knows when the output file is complete.
+FONTFORGE_WORKER_SCRIPT = """\
+import sys
+import fontforge
+for line in sys.stdin:
+    line = line.strip()
+    if not line:
+        continue
+    src, _, dst = line.partition("\\t")
+    try:
+        fontforge.open(src).generate(dst)
+        sys.stdout.write("__FF_OK__\\n")
+    except Exception as e:
+        sys.stdout.write("__FF_ERR__ " + str(e) + "\\n")
+    sys.stdout.flush()
+"""
 
-FONTFACE_WRAPPER = """@font-face {{
+FONTFACE_PREFIX = """@font-face {{
     font-family: '{fontname}';
-    src: url(data:application/font-woff2;charset=utf-8;base64,{b64encoding}) format('woff2');
+    src: url(data:application/font-woff2;charset=utf-8;base64,"""
+
+FONTFACE_SUFFIX = """) format('woff2');
     font-weight: normal;
     font-style: normal;
-}}"""
+}"""
 
 
 B64_FONT_LICENSE = """
@@ -75,6 +185,79 @@ Please do not use directly.
 log = logging.getLogger(__name__)
 
 
+class FontForgeWorker:
+    """
+    A long-lived FontForge subprocess fed conversion commands over stdin.
+
+    Spawning FontForge costs several hundred milliseconds of interpreter
+    startup per invocation; a driver converting many fonts can open one
+    worker as a context manager and run every conversion through it.
+    """
+
+    def __init__(self, fontforge_path: str, tstamp: Optional[float] = None):
+        self._fontforge_path = fontforge_path
+        self._tstamp = tstamp
+        self._proc: Optional[subprocess.Popen] = None
+
+    def __enter__(self) -> "FontForgeWorker":
+        subprocess_environment: dict = os.environ.copy()
+        if self._tstamp is not None:
+            subprocess_environment["SOURCE_DATE_EPOCH"] = f"{self._tstamp}"
+
+        self._proc = subprocess.Popen(
+            [self._fontforge_path, "-lang=py", "-c", FONTFORGE_WORKER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            env=subprocess_environment,
+        )
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self._proc is None:
+            return
+        if self._proc.stdin:
+            self._proc.stdin.close()
+        self._proc.wait()
+        self._proc = None
+
+    def convert(self, input_fontpath: str, output_fontpath: str) -> bool:
+        """
+        Converts one font, blocking until the worker acknowledges that the
+        output file has been written.
+
+        :param input_fontpath: Path to the font file to convert.
+        :param output_fontpath: Path of the file to generate; the extension
+            selects the output format, as with fontforge's generate().
+        :return: True if successful, False otherwise.
+        """
+        if self._proc is None or self._proc.stdin is None or self._proc.stdout is None:
+            log.error("The fontforge worker is not running.")
+            return False
+
+        log.debug("Fontforge worker converting %s to %s", input_fontpath, output_fontpath)
+        try:
+            self._proc.stdin.write(f"{input_fontpath}\t{output_fontpath}\n".encode())
+            self._proc.stdin.flush()
+        except OSError:
+            log.error("The fontforge worker exited unexpectedly.")
+            return False
+
+        while True:
+            line: bytes = self._proc.stdout.readline()
+            if not line:
+                log.error("The fontforge worker exited before finishing %s.", output_fontpath)
+                return False
+
+            text: str = line.decode(errors="replace").rstrip()
+            if text == "__FF_OK__":
+                return True
+            if text.startswith("__FF_ERR__"):
+                log.error("Fontforge could not convert %s: %s", input_fontpath, text[10:].strip())
+                return False
+            log.debug("fontforge: %s", text)
+
+
 def generate_smufl(opts: Namespace) -> bool:
     """
     Generates the `smufl.h` file for Verovio.
@@ -86,30 +269,28 @@ def generate_smufl(opts: Namespace) -> bool:
     header_out_pth: Path = Path(opts.header_out)
     header_file_pth: Path = Path(header_out_pth, "smufl.h")
 
-    if not supported_pth.is_file() or not os.access(supported_pth, os.R_OK):
-        log.error("Could not find or read %s file.", supported_pth)
-        return False
-
-    if not os.access(header_out_pth, os.W_OK):
-        log.error("Could not write to %s.", header_out_pth)
-        return False
-
     log.debug("SMuFL header will be stored in %s", header_out_pth)
-    supported_glyphs: dict = __get_supported_glyph_codes(supported_pth)
-
-    fmt_supported_glyphs: list = [
-        f"    SMUFL_{gcode}_{gname} = 0x{gcode}," for gcode, gname in supported_glyphs.items()
-    ]
+    try:
+        supported_glyphs: dict = __get_supported_glyph_codes(supported_pth)
+    except OSError as e:
+        log.error("Could not find or read %s file: %s", supported_pth, e)
+        return False
 
-    log.debug("SMuFL header will contain %s supported glyphs", len(fmt_supported_glyphs))
-    fmt_glyph_list = "\n".join(fmt_supported_glyphs)
-    fmt_header = SMUFL_HEADER.format(
-        smufl_glyph_list=fmt_glyph_list, len_smufl_codes=len(fmt_supported_glyphs)
-    )
+    num_glyphs: int = len(supported_glyphs)
 
+    log.debug("SMuFL header will contain %s supported glyphs", num_glyphs)
     log.debug("Writing %s", header_file_pth)
-    with open(header_file_pth, "w") as header_inc:
-        header_inc.write(fmt_header)
+    try:
+        with open(header_file_pth, "w") as header_inc:
+            header_inc.write(SMUFL_HEADER_PREFIX)
+            header_inc.writelines(
+                f"    SMUFL_{gcode}_{gname} = 0x{gcode},\n"
+                for gcode, gname in supported_glyphs.items()
+            )
+            header_inc.write(SMUFL_HEADER_SUFFIX.format(len_smufl_codes=num_glyphs))
+    except OSError as e:
+        log.error("Could not write to %s: %s", header_out_pth, e)
+        return False
 
     log.debug("Finished writing SMuFL header")
     return True
@@ -129,55 +310,55 @@ def extract_fonts(opts: Namespace) -> bool:
     source_pth: Path = Path(opts.source)
     font_data_pth: Path = Path(source_pth, fontname)
     metadata_pth: Path = Path(font_data_pth, f"{fontname.lower()}_metadata.json")
-    font_pth: Path = Path(source_pth, font_data_pth, f"{fontname}.svg")
+    font_pth: Path = Path(font_data_pth, f"{fontname}.svg")
     data_pth: Path = Path(opts.data)
     glyph_file_pth: Path = Path(data_pth, fontname)
     output_pth: Path = Path(data_pth, f"{fontname}.xml")
 
     log.debug("Extracting fonts for %s from %s", fontname, font_data_pth.resolve())
 
-    if not font_data_pth.is_dir() or not os.access(font_data_pth, os.R_OK):
-        log.error("Could not read font information from %s", font_data_pth)
-        return False
-
-    if not os.access(metadata_pth, os.R_OK):
-        log.error("Could not read %s. Does it exist?", metadata_pth)
-        return False
-
-    if not os.access(font_pth, os.R_OK):
-        log.error("Could not read %s. Does it exist?", font_pth)
+    try:
+        svg_data = __read_svg_font_file(str(font_pth))
+    except OSError as e:
+        log.error("Could not read %s: %s", font_pth, e)
         return False
 
-    if not os.access(data_pth, os.W_OK):
-        log.error("Could not write to %s. Check permissions.", data_pth)
+    if not svg_data:
+        log.error("Could not extract SVG data from %s", font_pth.resolve())
         return False
 
-    if not glyph_file_pth.is_dir():
+    if not opts.archive and not glyph_file_pth.is_dir():
         log.debug("Creating %s", glyph_file_pth)
         glyph_file_pth.mkdir(parents=True)
 
-    svg_data = __read_svg_font_file(str(font_pth))
-    if not svg_data:
-        log.error("Could not extract SVG data from %s", font_pth.resolve())
-        return False
-
     family, units, hax, glyphs = svg_data
 
-    log.debug(
-        "SVG Data extracted: Family: %s, Units: %s, H-A-X: %s, Number of glyphs: %s",
-        family,
-        units,
-        hax,
-        len(glyphs),
-    )
+    log.debug("SVG Data extracted: Family: %s, Units: %s, H-A-X: %s", family, units, hax)
 
     supported_glyphs: dict = __combine_alternates_and_supported(opts)
 
-    with open(metadata_pth, "r") as jfile:
-        metadata: dict = json.load(jfile)
+    try:
+        metadata: dict = __load_metadata(str(metadata_pth), metadata_pth.stat().st_mtime)
+    except OSError as e:
+        log.error("Could not read %s: %s", metadata_pth, e)
+        return False
+
+    try:
+        __write_glyph_outputs(
+            glyphs,
+            supported_glyphs,
+            family,
+            units,
+            hax,
+            metadata,
+            glyph_file_pth,
+            output_pth,
+            archive=opts.archive,
+        )
+    except OSError as e:
+        log.error("Could not write to %s: %s", data_pth, e)
+        return False
 
-    __write_xml_glyphs(glyphs, supported_glyphs, units, glyph_file_pth)
-    __write_bb_xml(glyphs, supported_glyphs, family, units, hax, metadata, output_pth)
     return True
 
 
@@ -208,24 +389,37 @@ def generate_css(opts: Namespace) -> bool:
     # Get the SVG source file's mtime for later...
     svg_mtime: float = font_pth.stat().st_mtime
 
-    Et.register_namespace("", SVG_NS["svg"])
-    svg_font: Et.ElementTree = Et.parse(str(font_pth))
-    font_el: Optional[Et.Element] = svg_font.find(".//svg:defs/svg:font", SVG_NS)
-    if not font_el:
+    if not HAS_LXML:
+        # lxml keeps the default namespace from the parsed document; plain
+        # ElementTree needs it registered again before serializing.
+        Et.register_namespace("", SVG_NS["svg"])
+    svg_font: Et.ElementTree = Et.parse(str(font_pth), XML_PARSER)
+    font_el: Optional[Et.Element] = next(iter(_XP_FONT(svg_font)), None)
+    if font_el is None:
         log.error("Could not find a font element in %s", font_pth.resolve())
         return False
 
     log.debug("Removing all hkern elements in since they are not needed.")
-    for hkern in font_el.findall(".//svg:hkern", SVG_NS):
-        font_el.remove(hkern)
-
-    for glyph in font_el.findall(".//svg:glyph", SVG_NS):
-        gname: Optional[str] = glyph.get("glyph-name")
-        if gname and gname != "space" and gname[-4:] not in supported_glyphs:
-            font_el.remove(glyph)
+    if HAS_LXML:
+        # a single C-level walk instead of a remove call per element
+        Et.strip_elements(font_el, f"{{{SVG_NS['svg']}}}hkern", with_tail=False)
+    else:
+        for hkern in _XP_HKERN(svg_font):
+            font_el.remove(hkern)
+
+    supported_set: frozenset = frozenset(supported_glyphs)
+    to_remove: list[Et.Element] = [
+        glyph
+        for glyph in _XP_GLYPH(svg_font)
+        if (gname := glyph.get("glyph-name"))
+        and gname != "space"
+        and gname[-4:] not in supported_set
+    ]
+    for glyph in to_remove:
+        font_el.remove(glyph)
 
     log.debug("Shortening metadata entry to the essentials.")
-    metadata_el: Optional[Et.Element] = svg_font.find(".//svg:metadata", SVG_NS)
+    metadata_el: Optional[Et.Element] = next(iter(_XP_METADATA(svg_font)), None)
     if metadata_el is not None:
         metadata_el.clear()
         metadata_el.text = B64_FONT_LICENSE.format(fontname=fontname)
@@ -238,21 +432,27 @@ def generate_css(opts: Namespace) -> bool:
     log.debug("Writing SVG font %s", tmp_svg_font.resolve())
     svg_font.write(str(tmp_svg_font), encoding="UTF-8", xml_declaration=True)
 
-    tmp_woff2_pth: Optional[Path] = __fontforge_svg2woff(opts, tmpdir, svg_mtime)
+    tmp_woff2_pth: Optional[Path] = None
+    if not opts.use_fontforge:
+        tmp_woff2_pth = __inprocess_svg2woff(opts, tmpdir, svg_mtime)
+
+    if not tmp_woff2_pth:
+        tmp_woff2_pth = __fontforge_svg2woff(opts, tmpdir, svg_mtime)
+
     if not tmp_woff2_pth:
         log.error("Could not create WOFF2")
         return False
 
     css_filename: Path = Path(opts.data, f"{fontname}.css")
 
-    with open(Path(tmpdir, f"{fontname}.woff2"), "rb") as woff2_content:
-        b64_encoding: bytes = base64.b64encode(woff2_content.read())
-        with open(css_filename, "w") as css_content:
-            log.debug("Writing CSS file %s", css_filename.resolve())
-            fmt_css: str = FONTFACE_WRAPPER.format(
-                fontname=fontname, b64encoding=b64_encoding.decode()
-            )
-            css_content.write(fmt_css)
+    log.debug("Writing CSS file %s", css_filename.resolve())
+    with open(tmp_woff2_pth, "rb") as woff2_content, open(css_filename, "w") as css_content:
+        css_content.write(FONTFACE_PREFIX.format(fontname=fontname))
+        # a chunk size that is a multiple of 3 bytes encodes without any
+        # padding mid-stream, so the concatenated pieces form valid base64
+        while chunk := woff2_content.read(57 * 1024):
+            css_content.write(base64.b64encode(chunk).decode("ascii"))
+        css_content.write(FONTFACE_SUFFIX)
 
     if opts.keep_intermediates:
         intermediate_pth: Path = Path(font_data_pth, "tmp")
@@ -267,14 +467,16 @@ def generate_css(opts: Namespace) -> bool:
     return True
 
 
-def generate_svg(opts: Namespace) -> bool:
+def generate_svg(opts: Namespace, worker: Optional[FontForgeWorker] = None) -> bool:
     """
     Generates a SVG font file from an input file using Fontforge.
 
     :param opts: A set of options from the argument parser sub-command.
+    :param worker: An already-running FontForgeWorker to reuse; when None a
+        worker is started just for this conversion.
     :return: True if successful, False otherwise.
     """
-    convert_res: bool = __fontforge_convert(opts, "svg")
+    convert_res: bool = __fontforge_convert(opts, "svg", worker)
     if not convert_res:
         log.error("A problem happened with the fontforge conversion to SVG.")
         return False
@@ -282,14 +484,16 @@ def generate_svg(opts: Namespace) -> bool:
     return True
 
 
-def generate_woff2(opts: Namespace) -> bool:
+def generate_woff2(opts: Namespace, worker: Optional[FontForgeWorker] = None) -> bool:
     """
     Generates a WOFF2 file using Fontforge
 
     :param opts: A set of options from the argument parser sub-command.
+    :param worker: An already-running FontForgeWorker to reuse; when None a
+        worker is started just for this conversion.
     :return: True if successful, False otherwise.
     """
-    convert_res: bool = __fontforge_convert(opts, "woff2")
+    convert_res: bool = __fontforge_convert(opts, "woff2", worker)
     if not convert_res:
         log.error("A problem happened with the fontforge conversion to WOFF2.")
         return False
@@ -313,25 +517,22 @@ def check(opts: Namespace) -> bool:
 
     all_glyphs: dict = __combine_alternates_and_supported(opts)
 
-    Et.register_namespace("", SVG_NS["svg"])
-    svg_font: Et.ElementTree = Et.parse(str(font_pth))
-    glyphs: list[Et.Element] = svg_font.findall(".//svg:glyph", SVG_NS)
-    glyph_names: list[str] = []
-    for g in glyphs:
-        if g is not None and (gn := g.get("glyph-name")):
-            # space is not given as octal in svg fonts
-            if gn == "space":
-                gn = "0020"
-            glyph_names.append(gn[-4:] if gn.startswith("uni") else gn)
-
-    supported_codes: set = set(all_glyphs.keys())
-    font_codes: set = set(glyph_names)
-
-    supported_codes_not_in_font: set = supported_codes.difference(font_codes)
-    font_codes_not_in_supported: set = font_codes.difference(supported_codes)
-
-    sc: list[str] = sorted(list(supported_codes_not_in_font))
-    fc: list[str] = sorted(list(font_codes_not_in_supported))
+    if not HAS_LXML:
+        Et.register_namespace("", SVG_NS["svg"])
+    svg_font: Et.ElementTree = Et.parse(str(font_pth), XML_PARSER)
+
+    # space is not given as octal in svg fonts
+    font_codes: set = {
+        "0020" if gn == "space" else (gn[-4:] if gn.startswith("uni") else gn)
+        for g in _XP_GLYPH(svg_font)
+        if (gn := g.get("glyph-name"))
+    }
+
+    # the dict keys view supports set difference directly
+    supported_codes = all_glyphs.keys()
+
+    sc: list[str] = sorted(supported_codes - font_codes)
+    fc: list[str] = sorted(font_codes - supported_codes)
     print(f"Verovio-supported glyphs not in {fontname}: ", ", ".join(sc))
     if opts.show_unsupported:
         print(f"{fontname} glyphs not supported by Verovio: ", ", ".join(fc))
@@ -349,10 +550,9 @@ def __combine_alternates_and_supported(opts) -> dict:
     metadata_pth: Path = Path(font_data_pth, f"{fontname.lower()}_metadata.json")
     supported_glyphs: dict = __get_supported_glyph_codes(opts.supported)
 
-    with open(metadata_pth, "r") as jsonfile:
-        metadata: dict = json.load(jsonfile)
-
-    if not os.access(metadata_pth, os.R_OK):
+    try:
+        metadata: dict = __load_metadata(str(metadata_pth), metadata_pth.stat().st_mtime)
+    except OSError:
         log.warning("The metadata file could not be read at %s", metadata_pth)
         return supported_glyphs
 
@@ -366,9 +566,17 @@ def __combine_alternates_and_supported(opts) -> dict:
 
 
 def __check_fontforge(opts: Namespace) -> Optional[str]:
-    fontforge_path: Optional[str] = (
-        shutil.which("fontforge") if not opts.fontforge else opts.fontforge
-    )
+    return __resolve_fontforge(opts.fontforge)
+
+
+@lru_cache(maxsize=4)
+def __resolve_fontforge(explicit: Optional[str]) -> Optional[str]:
+    """
+    Resolves and validates the fontforge executable. Cached so that repeated
+    conversions do not redo the PATH lookup; the explicit override is part
+    of the key, so overriding still works.
+    """
+    fontforge_path: Optional[str] = shutil.which("fontforge") if not explicit else explicit
     if fontforge_path is None:
         log.error("Could not find fontforge. It is required for this operation.")
         return None
@@ -381,13 +589,124 @@ def __check_fontforge(opts: Namespace) -> Optional[str]:
     return fontforge_path
 
 
+def __inprocess_svg2woff(opts: Namespace, tmpdir: str, tstamp: float) -> Optional[Path]:
+    """
+    Builds a WOFF2 font from the subset SVG font without spawning FontForge,
+    avoiding a subprocess boot and a second full font parse per call.
+
+    Every glyph outline is drawn through fontTools' SVG path parser into a
+    TrueType glyph (cubics converted to quadratics, as FontForge does for
+    TTF-flavored output) and the font is saved with fontTools' WOFF2 encoder.
+    Returns None when fontTools or its brotli backend is unavailable, or the
+    build fails, so the caller can fall back to FontForge.
+    """
+    try:
+        from fontTools.fontBuilder import FontBuilder  # type: ignore
+        from fontTools.misc.timeTools import timestampSinceEpoch  # type: ignore
+        from fontTools.pens.cu2quPen import Cu2QuPen  # type: ignore
+        from fontTools.pens.ttGlyphPen import TTGlyphPen  # type: ignore
+        from fontTools.svgLib.path import parse_path  # type: ignore
+    except ImportError:
+        log.debug("fontTools is not available. Falling back to fontforge.")
+        return None
+
+    fontname: str = opts.fontname
+    tmp_svg = Path(tmpdir, f"{fontname}.svg")
+    tmp_woff2 = Path(tmpdir, f"{fontname}.woff2")
+
+    svg_font: Et.ElementTree = Et.parse(str(tmp_svg), XML_PARSER)
+    font_el: Optional[Et.Element] = next(iter(_XP_FONT(svg_font)), None)
+    face_el: Optional[Et.Element] = next(iter(_XP_FONT_FACE(svg_font)), None)
+    if font_el is None or face_el is None:
+        log.debug("No font or font-face element found. Falling back to fontforge.")
+        return None
+
+    units_per_em = int(float(face_el.get("units-per-em", "1000")))
+    ascent = int(float(face_el.get("ascent", str(units_per_em))))
+    descent = int(float(face_el.get("descent", "0")))
+    default_hax = int(float(font_el.get("horiz-adv-x", "0"))) or units_per_em
+
+    glyph_order: list[str] = [".notdef"]
+    glyf: dict = {".notdef": TTGlyphPen(None).glyph()}
+    metrics: dict = {".notdef": (default_hax, 0)}
+    cmap: dict = {}
+    y_max: int = 0
+    y_min: int = 0
+
+    for g in _XP_GLYPH(font_el):
+        gname: Optional[str] = g.get("glyph-name")
+        if not gname or gname in glyf:
+            continue
+
+        tt_pen = TTGlyphPen(None)
+        path_d: Optional[str] = g.get("d")
+        if path_d:
+            try:
+                parse_path(path_d, Cu2QuPen(tt_pen, max_err=units_per_em / 1000))
+            except Exception as e:  # pylint: disable=broad-except
+                log.debug("Could not draw glyph %s (%s). Falling back to fontforge.", gname, e)
+                return None
+
+        glyph = tt_pen.glyph()
+        glyph_order.append(gname)
+        glyf[gname] = glyph
+        lsb = 0
+        if glyph.numberOfContours:
+            lsb = min(x for x, _ in glyph.coordinates)
+            y_max = max(y_max, max(y for _, y in glyph.coordinates))
+            y_min = min(y_min, min(y for _, y in glyph.coordinates))
+        metrics[gname] = (int(float(g.get("horiz-adv-x", str(default_hax)))), int(lsb))
+
+        # the glyph name carries the codepoint (uniXXXX, the same convention
+        # __emit_glyph relies on); ligature glyphs keep that name even though
+        # their unicode attribute holds several characters, so the name takes
+        # precedence and a single-character unicode attribute is the fallback
+        uni_name = UNI_GLYPH_NAME.fullmatch(gname)
+        if uni_name:
+            cmap.setdefault(int(uni_name.group(1), 16), gname)
+        else:
+            uni: Optional[str] = g.get("unicode")
+            if uni and len(uni) == 1:
+                cmap.setdefault(ord(uni), gname)
+
+    try:
+        builder = FontBuilder(units_per_em, isTTF=True)
+        builder.setupGlyphOrder(glyph_order)
+        builder.setupCharacterMap(cmap)
+        builder.setupGlyf(glyf)
+        builder.setupHorizontalMetrics(metrics)
+        # FontForge derives the vertical metrics from the glyph extents
+        # rather than the SVG font-face ascent/descent; anything smaller
+        # than the extents would let GDI-based renderers clip the glyphs
+        if y_max or y_min:
+            ascent, descent = int(y_max), int(y_min)
+        builder.setupHorizontalHeader(ascent=ascent, descent=descent)
+        builder.setupNameTable({"familyName": fontname, "styleName": "Regular"})
+        builder.setupOS2(
+            sTypoAscender=ascent,
+            sTypoDescender=descent,
+            usWinAscent=max(ascent, 0),
+            usWinDescent=max(-descent, 0),
+        )
+        builder.setupPost()
+        # keep the output reproducible, mirroring SOURCE_DATE_EPOCH
+        builder.font["head"].created = timestampSinceEpoch(tstamp)
+        builder.font["head"].modified = timestampSinceEpoch(tstamp)
+        builder.font.flavor = "woff2"
+        builder.font.save(str(tmp_woff2))
+    except Exception as e:  # pylint: disable=broad-except
+        log.debug("Could not build the WOFF2 file (%s). Falling back to fontforge.", e)
+        return None
+
+    log.debug("WOFF2 file generated in-process at %s", tmp_woff2.resolve())
+    return tmp_woff2
+
+
 def __fontforge_svg2woff(opts: Namespace, tmpdir: str, tstamp: float) -> Optional[Path]:
     fontforge_path: Optional[str] = __check_fontforge(opts)
     if not fontforge_path:
         return None
 
-    fontforge_cmd: list = [fontforge_path, "-lang=py", "-"]
-
     tmp_svg = Path(tmpdir, f"{opts.fontname}.svg")
     if not os.access(tmp_svg, os.R_OK):
         log.error(
@@ -398,70 +717,43 @@ def __fontforge_svg2woff(opts: Namespace, tmpdir: str, tstamp: float) -> Optiona
 
     tmp_woff2 = Path(tmpdir, f"{opts.fontname}.woff2")
 
-    ff_script: bytes = FONTFORGE_SCRIPT.format(
-        input_fontpath=str(tmp_svg), output_fontpath=str(tmp_woff2)
-    ).encode()
-
-    subprocess_environment: dict = os.environ.copy()
-    subprocess_environment["SOURCE_DATE_EPOCH"] = f"{tstamp}"
-
-    log.debug("Fontforge script: %s", str(ff_script))
-
-    try:
-        _: subprocess.CompletedProcess = subprocess.run(
-            fontforge_cmd, input=ff_script, check=True, env=subprocess_environment
-        )
-    except subprocess.CalledProcessError as e:
-        log.error(
-            "Fontforge exited with an error. Command: %s, Code: %s, Output: %s",
-            e.cmd,
-            e.returncode,
-            e.output,
-        )
-        return None
+    with FontForgeWorker(fontforge_path, tstamp) as worker:
+        if not worker.convert(str(tmp_svg), str(tmp_woff2)):
+            return None
 
     log.debug("WOFF2 file generated at %s", tmp_woff2.resolve())
     return tmp_woff2
 
 
-def __fontforge_convert(opts: Namespace, fmt: str) -> bool:
+def __fontforge_convert(
+    opts: Namespace, fmt: str, worker: Optional[FontForgeWorker] = None
+) -> bool:
     if fmt not in ("svg", "woff2"):
         log.error("Unknown conversion format %s. Must be either 'svg' or 'woff2'.", fmt)
         return False
 
-    fontforge_path: Optional[str] = __check_fontforge(opts)
-    if not fontforge_path:
-        return False
-
     fontname: str = opts.fontname
     font_pth: Path = Path(opts.fontfile)
 
-    font_mtime: float = font_pth.stat().st_mtime
-    subprocess_environment: dict = os.environ.copy()
-    subprocess_environment["SOURCE_DATE_EPOCH"] = font_mtime
-
-    if not font_pth.is_file() or not os.access(font_pth, os.R_OK):
-        log.error("Could not find or read %s.", font_pth)
+    try:
+        font_mtime: float = font_pth.stat().st_mtime
+    except OSError as e:
+        log.error("Could not find or read %s: %s", font_pth, e)
         return False
 
-    fontforge_cmd: list = [fontforge_path, "-lang=py", "-"]
-
     output_fontname: Path = Path(font_pth.parent, f"{fontname}.{fmt}")
 
-    ff_script: bytes = FONTFORGE_SCRIPT.format(
-        input_fontpath=str(font_pth), output_fontpath=str(output_fontname)
-    ).encode()
+    if worker is not None:
+        if not worker.convert(str(font_pth), str(output_fontname)):
+            return False
+    else:
+        fontforge_path: Optional[str] = __check_fontforge(opts)
+        if not fontforge_path:
+            return False
 
-    try:
-        _: subprocess.CompletedProcess = subprocess.run(fontforge_cmd, input=ff_script, check=True)
-    except subprocess.CalledProcessError as e:
-        log.error(
-            "Fontforge exited with an error. Command: %s, Code: %s, Output: %s",
-            e.cmd,
-            e.returncode,
-            e.output,
-        )
-        return False
+        with FontForgeWorker(fontforge_path, font_mtime) as one_shot:
+            if not one_shot.convert(str(font_pth), str(output_fontname)):
+                return False
 
     log.debug("Converted %s to %s", font_pth.resolve(), output_fontname.resolve())
     return True
@@ -470,159 +762,505 @@ def __fontforge_convert(opts: Namespace, fmt: str) -> bool:
 def __get_supported_glyph_codes(supported: Path) -> dict:
     """Retrieve dictionary with supported SMuFL codepoints and name."""
     log.debug("Getting supported glyph codes from %s", supported)
-    supported_xml = Et.parse(str(supported))
-    glyphs: list[Et.Element] = supported_xml.findall(".//glyph")
+    return dict(__load_supported_glyphs(str(supported), os.stat(supported).st_mtime))
+
+
+@lru_cache(maxsize=8)
+def __load_supported_glyphs(supported: str, mtime: float) -> tuple:
+    """
+    Parses a supported.xml file into (glyph-code, smufl-name) pairs.
+
+    Memoized so that sub-commands run back to back from a driver do not
+    reparse the same file; the mtime in the key invalidates stale entries.
+
+    The pairs are sorted numerically by codepoint, so every consumer gets a
+    stable order regardless of how supported.xml is arranged and the smufl.h
+    enum does not reshuffle when entries move around in the XML.
+    """
+    supported_xml = Et.parse(supported, XML_PARSER)
+    glyphs: list[Et.Element] = _XP_SUPPORTED_GLYPH(supported_xml)
 
     log.debug("Found %s supported glyphs", len(glyphs))
-    return {g.attrib["glyph-code"]: g.attrib["smufl-name"] for g in glyphs}
+    return tuple(
+        sorted(
+            ((g.attrib["glyph-code"], g.attrib["smufl-name"]) for g in glyphs),
+            key=lambda pair: int(pair[0], 16),
+        )
+    )
+
+
+@lru_cache(maxsize=8)
+def __load_metadata(metadata_pth: str, mtime: float) -> dict:
+    """
+    Loads a font metadata JSON file. Memoized like __load_supported_glyphs;
+    callers must treat the returned dict as read-only.
+    """
+    # both orjson and the stdlib parse straight from the raw bytes
+    return json_loads(Path(metadata_pth).read_bytes())
 
 
 def __read_svg_font_file(
     fontfile: str,
-) -> Optional[tuple[str, str, str, list[Et.Element]]]:
-    font_xml: Et.ElementTree = Et.parse(fontfile)
-    font_el: Optional[Et.Element] = font_xml.find("svg:defs/svg:font", SVG_NS)
-    if not font_el:
+) -> Optional[tuple[str, str, str, Iterator[Et.Element]]]:
+    header: Optional[tuple[str, str, str]] = __read_svg_font_header(fontfile)
+    if header is None:
+        return None
+
+    font_family, units_per_em, default_hax = header
+    return font_family, units_per_em, default_hax, __iter_svg_glyphs(fontfile)
+
+
+def __read_svg_font_header(fontfile: str) -> Optional[tuple[str, str, str]]:
+    """
+    Parses only the font and font-face declarations of an SVG font file,
+    stopping as soon as the first glyph is seen. This avoids building the
+    full DOM just to read a handful of header attributes.
+    """
+    font_attrs: Optional[dict] = None
+    font_faces: list[dict] = []
+
+    for _, elem in __iterparse(fontfile, ("start",)):
+        if elem.tag == SVG_FONT_TAG:
+            font_attrs = dict(elem.attrib)
+        elif elem.tag == SVG_FONT_FACE_TAG:
+            font_faces.append(dict(elem.attrib))
+        elif elem.tag == SVG_GLYPH_TAG:
+            break
+
+    if font_attrs is None:
         log.error("Could not find a font definition in %s.", fontfile)
         return None
 
-    font_faces: list[Et.Element] = font_xml.findall(".//svg:font-face", SVG_NS)
     if len(font_faces) != 1:
         log.error("Error: the file %s should have a unique font-face element.", fontfile)
         log.error("Please check that the svg has correct namespace: %s.", SVG_NS["svg"])
         return None
 
-    font_family: str = font_faces[0].attrib.get("font-family", "")
-    units_per_em: str = font_faces[0].attrib.get("units-per-em", "")
+    font_family: str = font_faces[0].get("font-family", "")
+    units_per_em: str = font_faces[0].get("units-per-em", "")
     if not font_family or not units_per_em:
         log.error("Error: Could not find a font family or units-per-em definition.")
         return None
 
-    default_hax = font_el.attrib.get("horiz-adv-x", "0")
-    glyphs: list[Et.Element] = font_xml.findall(".//svg:glyph", SVG_NS)
-    return font_family, units_per_em, default_hax, glyphs
+    default_hax: str = font_attrs.get("horiz-adv-x", "0")
+    return font_family, units_per_em, default_hax
 
 
-def __write_xml_glyphs(
-    glyphs: list[Et.Element],
-    supported_glyphs: dict,
-    units_per_em: str,
-    output: Path,
-) -> None:
-    log.debug("Writing individual glyph files to %s", output.resolve())
-    for glyph in glyphs:
-        glyph_name: Optional[str] = glyph.attrib.get("glyph-name")
-        if not glyph_name:
-            log.debug("Could not find a glyph name. Skipping")
-            continue
+def __iter_svg_glyphs(fontfile: str) -> Iterator[Et.Element]:
+    """
+    Streams the glyph elements of an SVG font file one at a time.
+
+    Each glyph is cleared (and, with lxml, detached from its parent) once the
+    consumer is done with it, so peak memory is bounded by a single glyph
+    rather than the whole font.
+    """
+    if HAS_LXML:
+        for _, elem in Et.iterparse(
+            fontfile, events=("end",), tag=SVG_GLYPH_TAG, huge_tree=True
+        ):
+            yield elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    else:
+        for _, elem in Et.iterparse(fontfile, events=("end",)):
+            if elem.tag == SVG_GLYPH_TAG:
+                yield elem
+            elem.clear()
 
-        # special treatment for space
-        code: str = "0020" if glyph_name == "space" else glyph_name[-4:]
-        if code not in supported_glyphs:
-            log.debug("Glyph code %s is not supported. Skipping", code)
-            continue
 
-        rt: Et.Element = Et.Element("symbol")
-        rt.set("id", code)
-        rt.set("viewBox", f"0 0 {units_per_em} {units_per_em}")
-        rt.set("overflow", "inherit")
-        if "d" in glyph.attrib:
-            pth = Et.SubElement(rt, "path")
-            pth.set("transform", "scale(1,-1)")
-            pth.set("d", glyph.attrib["d"])
+def __iterparse(fontfile: str, events: tuple):
+    if HAS_LXML:
+        return Et.iterparse(fontfile, events=events, huge_tree=True)
+    return Et.iterparse(fontfile, events=events)
 
-        tr: Et.ElementTree = Et.ElementTree(rt)
-        glyph_pth: Path = Path(output, f"{code}.xml")
-        log.debug("Writing %s", glyph_pth.resolve())
-        tr.write(str(glyph_pth), encoding="UTF-8")
 
+def __fast_path_bbox(d: str) -> tuple[float, float, float, float]:
+    """
+    Computes the bounding box (xmin, xmax, ymin, ymax) of an SVG path.
 
-def __write_bb_xml(
-    glyphs: list[Et.Element],
+    Tokenizes the path data once and evaluates the Bezier extrema for all
+    curve segments in vectorized NumPy calls, which is much faster than
+    svgpathtools' segment-by-segment bbox. Arc segments are rare in font
+    outlines, so paths containing them (and any path when NumPy is missing)
+    fall back to svgpathtools.
+    """
+    if not HAS_NUMPY or "A" in d or "a" in d:
+        return SvgPath(d).bbox()
+
+    xs: list[float] = []
+    ys: list[float] = []
+    cubics: list[tuple] = []  # (x0, x1, x2, x3, y0, y1, y2, y3)
+    quads: list[tuple] = []  # (x0, x1, x2, y0, y1, y2)
+
+    # a command match leaves group 1 set (a non-empty string), so the `or`
+    # falls through to the numeric group exactly when group 1 is None
+    toks: list = [m[1] or float(m[2]) for m in PATH_TOKEN.finditer(d)]
+
+    cx = cy = 0.0  # current point
+    sx = sy = 0.0  # subpath start
+    ctrl_c: Optional[tuple[float, float]] = None  # last cubic control point
+    ctrl_q: Optional[tuple[float, float]] = None  # last quadratic control point
+    cmd: str = ""
+    i = 0
+    n = len(toks)
+
+    while i < n:
+        tok = toks[i]
+        if isinstance(tok, str):
+            cmd = tok
+            i += 1
+            if cmd in "Zz":
+                cx, cy = sx, sy
+                ctrl_c = ctrl_q = None
+                continue
+        elif not cmd:
+            # numbers before any command: give up and let svgpathtools
+            # report the malformed path data
+            return SvgPath(d).bbox()
+        elif cmd in "Mm":
+            # implicit line-to after a move-to
+            cmd = "L" if cmd == "M" else "l"
+
+        rel = cmd.islower()
+        if cmd in "Mm":
+            x, y = toks[i], toks[i + 1]
+            i += 2
+            cx, cy = (cx + x, cy + y) if rel else (x, y)
+            sx, sy = cx, cy
+            ctrl_c = ctrl_q = None
+        elif cmd in "Ll":
+            x, y = toks[i], toks[i + 1]
+            i += 2
+            cx, cy = (cx + x, cy + y) if rel else (x, y)
+            ctrl_c = ctrl_q = None
+        elif cmd in "Hh":
+            x = toks[i]
+            i += 1
+            cx = cx + x if rel else x
+            ctrl_c = ctrl_q = None
+        elif cmd in "Vv":
+            y = toks[i]
+            i += 1
+            cy = cy + y if rel else y
+            ctrl_c = ctrl_q = None
+        elif cmd in "CcSs":
+            if cmd in "Cc":
+                x1, y1, x2, y2, x, y = toks[i : i + 6]
+                i += 6
+                if rel:
+                    x1, y1, x2, y2, x, y = x1 + cx, y1 + cy, x2 + cx, y2 + cy, x + cx, y + cy
+            else:
+                x2, y2, x, y = toks[i : i + 4]
+                i += 4
+                if rel:
+                    x2, y2, x, y = x2 + cx, y2 + cy, x + cx, y + cy
+                # reflect the previous cubic control point, if any
+                x1, y1 = (2 * cx - ctrl_c[0], 2 * cy - ctrl_c[1]) if ctrl_c else (cx, cy)
+            cubics.append((cx, x1, x2, x, cy, y1, y2, y))
+            cx, cy = x, y
+            ctrl_c = (x2, y2)
+            ctrl_q = None
+        elif cmd in "QqTt":
+            if cmd in "Qq":
+                x1, y1, x, y = toks[i : i + 4]
+                i += 4
+                if rel:
+                    x1, y1, x, y = x1 + cx, y1 + cy, x + cx, y + cy
+            else:
+                x, y = toks[i], toks[i + 1]
+                i += 2
+                if rel:
+                    x, y = x + cx, y + cy
+                x1, y1 = (2 * cx - ctrl_q[0], 2 * cy - ctrl_q[1]) if ctrl_q else (cx, cy)
+            quads.append((cx, x1, x, cy, y1, y))
+            cx, cy = x, y
+            ctrl_q = (x1, y1)
+            ctrl_c = None
+        else:
+            # unknown state (e.g. numbers after a close-path): give up
+            return SvgPath(d).bbox()
+
+        xs.append(cx)
+        ys.append(cy)
+
+    cand_x: list = [np.asarray(xs)]
+    cand_y: list = [np.asarray(ys)]
+
+    if cubics:
+        seg = np.asarray(cubics)
+        for cand, off in ((cand_x, 0), (cand_y, 4)):
+            p0, p1, p2, p3 = seg[:, off], seg[:, off + 1], seg[:, off + 2], seg[:, off + 3]
+            # roots of the derivative a*t^2 + 2*b*t + c = 0
+            a = -p0 + 3 * p1 - 3 * p2 + p3
+            b = p0 - 2 * p1 + p2
+            c = p1 - p0
+            sq = np.sqrt(np.maximum(b * b - a * c, 0.0))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                lin = np.where(np.abs(b) > 1e-12, -c / (2 * b), np.nan)
+                t1 = np.where(np.abs(a) > 1e-12, (-b + sq) / a, lin)
+                t2 = np.where(np.abs(a) > 1e-12, (-b - sq) / a, np.nan)
+            for t in (t1, t2):
+                # invalid roots collapse to t=0, i.e. the segment start point,
+                # which is already counted among the endpoints
+                t = np.where(np.isfinite(t) & (t > 0.0) & (t < 1.0), t, 0.0)
+                pts = (
+                    (1 - t) ** 3 * p0
+                    + 3 * (1 - t) ** 2 * t * p1
+                    + 3 * (1 - t) * t**2 * p2
+                    + t**3 * p3
+                )
+                cand.append(pts)
+
+    if quads:
+        seg = np.asarray(quads)
+        for cand, off in ((cand_x, 0), (cand_y, 3)):
+            p0, p1, p2 = seg[:, off], seg[:, off + 1], seg[:, off + 2]
+            den = p0 - 2 * p1 + p2
+            with np.errstate(divide="ignore", invalid="ignore"):
+                t = np.where(np.abs(den) > 1e-12, (p0 - p1) / den, np.nan)
+            t = np.where(np.isfinite(t) & (t > 0.0) & (t < 1.0), t, 0.0)
+            pts = (1 - t) ** 2 * p0 + 2 * (1 - t) * t * p1 + t**2 * p2
+            cand.append(pts)
+
+    all_x = np.concatenate(cand_x)
+    all_y = np.concatenate(cand_y)
+    return float(all_x.min()), float(all_x.max()), float(all_y.min()), float(all_y.max())
+
+
+def __write_glyph_outputs(
+    glyphs: Iterator[Et.Element],
     supported_glyphs: dict,
     family: str,
     units_per_em: str,
     default_hax: str,
     metadata: dict,
+    glyph_dir: Path,
     output: Path,
+    archive: bool = False,
 ) -> None:
+    """
+    Consumes the glyph stream in a single pass, appending the bounding-boxes
+    entry for each glyph before it is freed and dispatching the symbol files
+    to the writers in small batches, so only a bounded number of path
+    strings is retained at any point of the walk.
+
+    With archive=True the symbol files go into a single uncompressed tar
+    next to the glyph directory instead of one file each.
+    """
+    log.debug("Writing individual glyph files to %s", glyph_dir.resolve())
     log.debug("Writing Verovio bounding-boxes file for %s", family)
     root: Et.Element = Et.Element("bounding-boxes")
     root.set("font-family", family)
     root.set("units-per-em", units_per_em)
+
+    # index the anchors by glyph code up front, with the coordinate strings
+    # already rounded, so the per-glyph loop is a straight iteration
     all_glyph_anchors: dict = metadata.get("glyphsWithAnchors", {})
+    name_to_code: dict = {name: code for code, name in supported_glyphs.items()}
+    code_to_anchors: dict = {}
+    for name, anchors in all_glyph_anchors.items():
+        anchor_code: Optional[str] = name_to_code.get(name)
+        if anchor_code:
+            code_to_anchors[anchor_code] = [
+                (nm, str(round(xy[0], 2)), str(round(xy[1], 2))) for nm, xy in anchors.items()
+            ]
+
+    symbol_tasks: list[tuple] = []
+    out_dir: str = str(glyph_dir)
+    tar: Optional[tarfile.TarFile] = None
+    executor: Optional[ProcessPoolExecutor] = None
+    pending: deque[Future] = deque()
+    if archive:
+        archive_pth: Path = glyph_dir.with_suffix(".tar")
+        log.debug("Writing glyph archive %s", archive_pth.resolve())
+        tar = tarfile.open(archive_pth, "w")
+    else:
+        # each glyph file is independent, so serialization and the write
+        # syscalls can be spread across all cores
+        executor = ProcessPoolExecutor()
 
-    for glyph in glyphs:
-        glyph_name: Optional[str] = glyph.attrib.get("glyph-name")
-        if not glyph_name:
-            log.debug("Could not find a glyph name. Skipping")
-            continue
+    try:
+        for glyph in glyphs:
+            __emit_glyph(
+                glyph, supported_glyphs, units_per_em, default_hax, code_to_anchors, out_dir,
+                symbol_tasks, root
+            )
+            if len(symbol_tasks) >= SYMBOL_BATCH_SIZE:
+                __dispatch_symbols(symbol_tasks, tar, executor, pending)
+                symbol_tasks = []
+        if symbol_tasks:
+            __dispatch_symbols(symbol_tasks, tar, executor, pending)
+        # surface any worker failure before declaring the extraction done
+        for future in pending:
+            future.result()
+    finally:
+        if tar is not None:
+            tar.close()
+        if executor is not None:
+            executor.shutdown()
 
-        # special treatment for space
-        code: str = "0020" if glyph_name == "space" else glyph_name[-4:]
-        if code not in supported_glyphs:
-            continue
+    tree: Et.ElementTree = Et.ElementTree(root)
+    log.debug("Writing SVG file %s", output.resolve())
+    Et.indent(tree)
+    if HAS_LXML:
+        # lxml closes empty elements with '"/>'; the checked-in files come
+        # from ElementTree, which writes '" />', so normalize to keep
+        # regenerated files byte-identical (attribute values cannot contain
+        # a raw quote, making the replacement unambiguous)
+        data: bytes = Et.tostring(root, encoding="UTF-8", xml_declaration=True)
+        output.write_bytes(data.replace(b'"/>', b'" />'))
+    else:
+        tree.write(str(output), encoding="UTF-8", xml_declaration=True)
 
-        g_element: Et.Element = Et.SubElement(root, "g")
-        g_element.set("c", code)
 
-        if "d" in glyph.attrib:
-            svg_path = SvgPath(glyph.attrib["d"])
-            xmin, xmax, ymin, ymax = svg_path.bbox()
-            g_element.set("x", str(round(xmin, 2)))
-            g_element.set("y", str(round(ymin, 2)))
-            g_element.set("w", str(round(xmax - xmin, 2)))
-            g_element.set("h", str(round(ymax - ymin, 2)))
-        else:
-            g_element.set("x", str(0.0))
-            g_element.set("y", str(0.0))
-            g_element.set("w", str(0.0))
-            g_element.set("h", str(0.0))
+def __write_one_symbol(task: tuple) -> None:
+    """
+    Serializes and writes a single glyph symbol file.
 
-        # set set horiz-av-x
-        g_element.set("h-a-x", glyph.attrib.get("horiz-adv-x", default_hax))
+    Top-level (picklable) so that it can run in a ProcessPoolExecutor worker.
+    The output is trivial enough that an f-string is much faster than going
+    through an XML serializer.
+    """
+    code, _, _, out_dir = task
+    # plain-string join: no Path object needs to be built per glyph
+    with open(os.path.join(out_dir, f"{code}.xml"), "wb") as symbol_file:
+        symbol_file.write(__render_symbol(task))
+
+
+def __render_symbol(task: tuple) -> bytes:
+    code, path_d, units_per_em, _ = task
+    if path_d is not None:
+        # path data rarely contains XML-special characters, but be safe
+        data: str = SYMBOL_TMPL.format(
+            code=code, units=units_per_em, path_d=escape(path_d, {'"': "&quot;"})
+        )
+    else:
+        data = SYMBOL_EMPTY_TMPL.format(code=code, units=units_per_em)
+    return data.encode()
 
-        # Check if the value set for the "w" parameter can be converted to a float.
-        # If not, set it to a default value. Somewhat complicated by also trying
-        # to check if the element has an attribute of "w", or if it's None.
-        try:
-            wval: Optional[str] = g_element.get("w")
-            if not wval:
-                raise TypeError
-            _ = float(wval)
-        except TypeError:
-            g_element.set("w", glyph.attrib.get("horiz-adv-x", default_hax))
-
-        current_glyphname: Optional[str] = supported_glyphs.get(code)
-        if current_glyphname:
-            g_element.set("n", current_glyphname)
-            g_anchors: dict = all_glyph_anchors.get(current_glyphname, {})
-            for nm, anc in g_anchors.items():
-                a_element = Et.SubElement(g_element, "a")
-                a_element.set("n", nm)
-                a_element.set("x", str(round(anc[0], 2)))
-                a_element.set("y", str(round(anc[1], 2)))
 
-    tree: Et.ElementTree = Et.ElementTree(root)
-    Et.indent(tree)
-    log.debug("Writing SVG file %s", output.resolve())
-    tree.write(str(output), encoding="UTF-8", xml_declaration=True)
+def __dispatch_symbols(
+    batch: list,
+    tar: Optional[tarfile.TarFile],
+    executor: Optional[ProcessPoolExecutor],
+    pending: deque,
+) -> None:
+    """
+    Hands one batch of symbol tasks to the open tar archive or the process
+    pool. Pool submissions are capped at SYMBOL_MAX_PENDING outstanding
+    batches, blocking on the oldest one when the walk gets ahead of the
+    writers, so the tasks' path data never accumulates unboundedly.
+    """
+    if tar is not None:
+        # a single uncompressed tar turns thousands of tiny file creations
+        # into one sequential write
+        for task in batch:
+            data: bytes = __render_symbol(task)
+            info = tarfile.TarInfo(f"{task[0]}.xml")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+        return
+
+    if len(pending) >= SYMBOL_MAX_PENDING:
+        pending.popleft().result()
+    pending.append(executor.submit(__write_symbol_batch, batch))
+
+
+def __write_symbol_batch(tasks: list) -> None:
+    """
+    Writes one batch of glyph symbol files.
 
+    Top-level (picklable) so that it can run in a ProcessPoolExecutor worker;
+    batching keeps the pickling overhead per glyph negligible.
+    """
+    for task in tasks:
+        __write_one_symbol(task)
 
-def __get_alternate_glyphs(glyphs: dict, metadata: dict) -> dict:
-    glyph_alternates: dict = metadata.get("glyphsWithAlternates", {})
-    inverted_glyphs: dict = {v: k for k, v in glyphs.items()}
-    additional_glyphs: dict = {}
 
-    for name, alternates in glyph_alternates.items():
-        code: Optional[str] = inverted_glyphs.get(name)
-        if not code:
-            continue
+def __emit_glyph(
+    glyph: Et.Element,
+    supported_glyphs: dict,
+    units_per_em: str,
+    default_hax: str,
+    code_to_anchors: dict,
+    out_dir: str,
+    symbol_tasks: list,
+    bb_root: Et.Element,
+) -> None:
+    """
+    Filters a single glyph against the supported set, queues its symbol file
+    for writing and appends its bounding-box entry to the accumulated tree.
+    """
+    glyph_name: Optional[str] = glyph.attrib.get("glyph-name")
+    if not glyph_name:
+        log.debug("Could not find a glyph name. Skipping")
+        return
+
+    # special treatment for space
+    code: str = "0020" if glyph_name == "space" else glyph_name[-4:]
+    if code not in supported_glyphs:
+        log.debug("Glyph code %s is not supported. Skipping", code)
+        return
+
+    symbol_tasks.append((code, glyph.attrib.get("d"), units_per_em, out_dir))
+
+    g_element: Et.Element = Et.SubElement(bb_root, "g")
+    g_element.set("c", code)
+
+    if "d" in glyph.attrib:
+        xmin, xmax, ymin, ymax = __fast_path_bbox(glyph.attrib["d"])
+        # adding 0.0 normalizes the -0.0 that rounding tiny negatives yields
+        g_element.set("x", str(round(xmin, 2) + 0.0))
+        g_element.set("y", str(round(ymin, 2) + 0.0))
+        g_element.set("w", str(round(xmax - xmin, 2) + 0.0))
+        g_element.set("h", str(round(ymax - ymin, 2) + 0.0))
+    else:
+        g_element.set("x", str(0.0))
+        g_element.set("y", str(0.0))
+        g_element.set("w", str(0.0))
+        g_element.set("h", str(0.0))
+
+    # set set horiz-av-x
+    g_element.set("h-a-x", glyph.attrib.get("horiz-adv-x", default_hax))
+
+    # Check if the value set for the "w" parameter can be converted to a float.
+    # If not, set it to a default value. Somewhat complicated by also trying
+    # to check if the element has an attribute of "w", or if it's None.
+    try:
+        wval: Optional[str] = g_element.get("w")
+        if not wval:
+            raise TypeError
+        _ = float(wval)
+    except TypeError:
+        g_element.set("w", glyph.attrib.get("horiz-adv-x", default_hax))
+
+    current_glyphname: Optional[str] = supported_glyphs.get(code)
+    if current_glyphname:
+        g_element.set("n", current_glyphname)
+        for nm, anchor_x, anchor_y in code_to_anchors.get(code, ()):
+            a_element = Et.SubElement(g_element, "a")
+            a_element.set("n", nm)
+            a_element.set("x", anchor_x)
+            a_element.set("y", anchor_y)
 
-        for alt in alternates["alternates"]:
-            additional_glyphs[alt["codepoint"][2:]] = alt["name"]
 
-    log.debug("Found %s alternate glyphs", len(additional_glyphs.keys()))
+def __get_alternate_glyphs(glyphs: dict, metadata: dict) -> dict:
+    glyph_alternates: dict = metadata.get("glyphsWithAlternates", {})
+    if not glyph_alternates:
+        return {}
+
+    # a set of the supported names is all that is needed to filter the
+    # alternates table; no code-by-name reverse map has to be built
+    supported_names: set = set(glyphs.values())
+    additional_glyphs: dict = {
+        alt["codepoint"][2:]: alt["name"]
+        for name, alternates in glyph_alternates.items()
+        if name in supported_names
+        for alt in alternates["alternates"]
+    }
+
+    log.debug("Found %s alternate glyphs", len(additional_glyphs))
     return additional_glyphs
 
 
@@ -650,6 +1288,11 @@ if __name__ == "__main__":
         "--data", help="Path to the Verovio data directory", default="../data"
     )
     parser_extract.add_argument("--source", help="The font source parent directory", default="./")
+    parser_extract.add_argument(
+        "--archive",
+        help="Write the glyph files into a single uncompressed tar archive instead of a directory.",
+        action="store_true",
+    )
     parser_extract.set_defaults(func=extract_fonts)
 
     css_description = """
@@ -672,6 +1315,11 @@ if __name__ == "__main__":
         help="Path to fontforge binary (default is to auto-detect on the path)",
         default=None,
     )
+    parser_css.add_argument(
+        "--use-fontforge",
+        help="Always convert to WOFF2 with FontForge instead of in-process with fontTools.",
+        action="store_true",
+    )
     parser_css.add_argument("--keep-intermediates", help=keep_help, action="store_true")
     parser_css.set_defaults(func=generate_css)
 
@@ -2,6 +2,9 @@
 
 # Requires python
 # Requires svgpathtools python library (install with 'pip3 install svgpathtools')
+# Runs much faster with the optional lxml, fonttools, brotli and orjson
+# libraries (install with 'pip3 install lxml fonttools brotli orjson');
+# generate.py falls back to the stdlib and FontForge without them
 
 PYTHON="python3"
 
@@ -624,7 +624,6 @@ enum {
     SMUFL_EC84_timeSigSlash = 0xEC84,
     SMUFL_EC85_timeSigCut2 = 0xEC85,
     SMUFL_EC86_timeSigCut3 = 0xEC86,
-    SMUFL_ECC0_figbass7Diminished = 0xECC0,
     SMUFL_ECA0_metNoteDoubleWhole = 0xECA0,
     SMUFL_ECA1_metNoteDoubleWholeSquare = 0xECA1,
     SMUFL_ECA2_metNoteWhole = 0xECA2,
@@ -639,6 +638,7 @@ enum {
     SMUFL_ECB3_metNote512thUp = 0xECB3,
     SMUFL_ECB5_metNote1024thUp = 0xECB5,
     SMUFL_ECB7_metAugmentationDot = 0xECB7,
+    SMUFL_ECC0_figbass7Diminished = 0xECC0,
     SMUFL_ED40_articSoftAccentAbove = 0xED40,
     SMUFL_ED41_articSoftAccentBelow = 0xED41,
 };